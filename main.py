@@ -2,66 +2,35 @@ import sys
 import os
 import subprocess
 import pty
-import threading
-import select
+import re
 import sqlite3
+from collections import OrderedDict, deque
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTreeView, QVBoxLayout, QWidget,
     QHBoxLayout, QToolBar, QPushButton, QStatusBar, QTextEdit,
-    QSplitter, QDialog, QDialogButtonBox, QLabel, QLineEdit, QFormLayout,
+    QPlainTextEdit, QSplitter, QDialog, QDialogButtonBox, QLabel, QLineEdit, QFormLayout,
     QMessageBox, QScrollArea, QSplashScreen, QFrame, QComboBox
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, QRegularExpression, QObject, pyqtSignal
-from PyQt6.QtGui import QFont, QFileSystemModel, QPixmap, QSyntaxHighlighter, QTextCharFormat, QColor, QTextCursor
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QSocketNotifier, QSortFilterProxyModel, QRegularExpression
+)
+from PyQt6.QtGui import QBitmap, QFont, QFileSystemModel, QPixmap, QSyntaxHighlighter, QTextCharFormat, QColor, QTextCursor
 
 
-class TerminalOutputReader(QObject):
-    """
-    A thread-safe reader for terminal output that uses Qt's signal/slot mechanism
-    to safely update the GUI from a background thread.
-    """
-    # Define a signal for new output
-    outputReceived = pyqtSignal(str)
-
-    def __init__(self, master_fd):
-        """Initialize the output reader with the master file descriptor."""
-        super().__init__()
-        self.master_fd = master_fd
-        self.running = True
-
-    def read_output(self):
-        """
-        Continuously read output from the terminal and emit it through a signal.
-        This method runs in a separate thread.
-        """
-        while self.running:
-            try:
-                # Check for available data with a timeout
-                r, _, _ = select.select([self.master_fd], [], [], 0.1)
-                if r:
-                    # Read available data
-                    output = os.read(self.master_fd, 1024).decode()
-                    # Emit the output through the signal
-                    self.outputReceived.emit(output)
-            except (OSError, UnicodeDecodeError) as e:
-                # Handle potential errors during reading
-                if self.running:  # Only emit error if we're still supposed to be running
-                    self.outputReceived.emit(f"\nError reading output: {str(e)}\n")
-                break
-
-    def stop(self):
-        """Safely stop the output reader."""
-        self.running = False
+# CSI escape sequences (colors, cursor movement) emitted by the shell.
+# Compiled once on bytes so chunks are scrubbed before they are decoded.
+_ANSI_ESCAPE_RE = re.compile(rb'\x1b\[[0-9;?]*[ -/]*[@-~]')
 
 
 class TerminalEmulator(QWidget):
     """
-    A thread-safe terminal emulator widget that provides a Unix-like shell interface.
-    Uses Qt's event system to safely handle communication between the GUI and shell process.
+    A terminal emulator widget that provides a Unix-like shell interface.
+    Shell output is delivered through a QSocketNotifier on the GUI thread,
+    so no reader thread or cross-thread signalling is needed.
     """
 
     def __init__(self, parent=None):
-        """Initialize the terminal emulator with proper thread safety."""
+        """Initialize the terminal emulator."""
         super().__init__(parent)
         self.setup_terminal()
         self.start_shell()
@@ -71,12 +40,17 @@ class TerminalEmulator(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Create output display area
-        self.terminal_output = QTextEdit()
+        # Create output display area. QPlainTextEdit lays text out as a flat
+        # list of same-height blocks instead of going through the rich-text
+        # engine, which makes high-volume appends far cheaper than QTextEdit
+        self.terminal_output = QPlainTextEdit()
         self.terminal_output.setReadOnly(True)
-        self.terminal_output.setFont(QFont("Consolas", 11))
+        # Cap the scrollback: appending to an ever-growing document turns
+        # quadratic, and a long shell session would freeze the UI
+        self.terminal_output.setMaximumBlockCount(5000)
+        self.terminal_output.setFont(_TERMINAL_FONT)
         self.terminal_output.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #ffffff;
                 border: 2px solid #e9ecef;
                
@@ -87,7 +61,7 @@ class TerminalEmulator(QWidget):
 
         # Create command input line
         self.command_input = QLineEdit()
-        self.command_input.setFont(QFont("Consolas", 11))
+        self.command_input.setFont(_TERMINAL_FONT)
         self.command_input.setStyleSheet("""
             QLineEdit {
                 background-color: #2D2D2D;
@@ -111,8 +85,11 @@ class TerminalEmulator(QWidget):
         layout.addWidget(self.terminal_output)
         layout.addLayout(input_layout)
 
+        # Reused cursor for appending output without re-fetching one per chunk
+        self._end_cursor = self.terminal_output.textCursor()
+
     def start_shell(self):
-        """Initialize the shell process with proper thread handling."""
+        """Initialize the shell process and wire up readiness notification."""
         try:
             # Create pseudo-terminal
             master_fd, slave_fd = pty.openpty()
@@ -132,32 +109,51 @@ class TerminalEmulator(QWidget):
             # Store master file descriptor
             self.master_fd = master_fd
 
-            # Create and configure output reader
-            self.output_reader = TerminalOutputReader(self.master_fd)
-            self.output_reader.outputReceived.connect(self.update_terminal_output)
-
-            # Start reader thread
-            self.reader_thread = threading.Thread(target=self.output_reader.read_output)
-            self.reader_thread.daemon = True
-            self.reader_thread.start()
+            # Non-blocking reads driven by the event loop: the notifier
+            # fires on the GUI thread whenever the fd becomes readable, so
+            # there is no polling loop and no queued cross-thread signal
+            os.set_blocking(master_fd, False)
+            self.notifier = QSocketNotifier(master_fd, QSocketNotifier.Type.Read, self)
+            self.notifier.activated.connect(self.read_shell_output)
 
         except Exception as e:
             QMessageBox.critical(self, "Terminal Error", f"Failed to start terminal: {str(e)}")
 
-    def update_terminal_output(self, output):
-        """
-        Update the terminal output in a thread-safe way.
-        This slot is automatically called in the GUI thread.
-        """
+    def read_shell_output(self):
+        """Drain everything available from the pty and append it in one go."""
+        buffer = bytearray()
         try:
-            self.terminal_output.insertPlainText(output)
-            # Scroll to bottom
-            cursor = self.terminal_output.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.terminal_output.setTextCursor(cursor)
-        except RuntimeError:
-            # Widget has been deleted, stop the reader
-            self.cleanup()
+            while True:
+                chunk = os.read(self.master_fd, 65536)
+                if not chunk:
+                    # EOF: the shell has exited
+                    self.notifier.setEnabled(False)
+                    break
+                buffer += chunk
+        except BlockingIOError:
+            pass
+        except OSError:
+            self.notifier.setEnabled(False)
+
+        if buffer:
+            # Strip ANSI color/cursor escapes before decoding: the pane
+            # renders plain text, so they would only show up as CSI noise.
+            # errors='replace' keeps a multibyte sequence split across
+            # reads from raising mid-stream
+            text = _ANSI_ESCAPE_RE.sub(b'', buffer).decode(errors='replace')
+            self.update_terminal_output(text)
+
+    def update_terminal_output(self, output):
+        """Append shell output to the terminal display."""
+        scrollbar = self.terminal_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        self._end_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._end_cursor.insertText(output)
+
+        # Only follow the output if the user has not scrolled back
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def execute_command(self):
         """Execute the command in a thread-safe manner."""
@@ -165,7 +161,7 @@ class TerminalEmulator(QWidget):
             command = self.command_input.text()
             if command.strip():
                 # Display command in output
-                self.terminal_output.append(f"$ {command}")
+                self.terminal_output.appendPlainText(f"$ {command}")
 
                 # Send command to shell
                 os.write(self.master_fd, (command + '\n').encode())
@@ -173,15 +169,15 @@ class TerminalEmulator(QWidget):
                 # Clear input line
                 self.command_input.clear()
         except OSError as e:
-            self.terminal_output.append(f"\nError executing command: {str(e)}\n")
+            self.terminal_output.appendPlainText(f"\nError executing command: {str(e)}\n")
 
     def cleanup(self):
         """
         Clean up resources safely.
-        This method ensures proper shutdown of threads and processes.
+        This method ensures proper shutdown of the shell process.
         """
-        if hasattr(self, 'output_reader'):
-            self.output_reader.stop()
+        if hasattr(self, 'notifier'):
+            self.notifier.setEnabled(False)
 
         if hasattr(self, 'shell_process'):
             try:
@@ -201,179 +197,69 @@ class TerminalEmulator(QWidget):
         self.cleanup()
         super().closeEvent(event)
 
-class CodeSyntaxHighlighter(QSyntaxHighlighter):
-    """
-    A syntax highlighter for programming code that supports multiple languages.
-    Provides color-coding for keywords, strings, comments, and other code elements.
-    """
-
-    def __init__(self, parent, language='python'):
-        super().__init__(parent)
-        self.language = language
-        self.highlighting_rules = []
-        self.setup_highlighting_rules()
-
-    def setup_highlighting_rules(self):
-        """Configure syntax highlighting rules based on the selected language."""
-        self.highlighting_rules = []
-
-        # Define color formats for different code elements
-        keyword_format = self.create_format("#FF7043")  # Orange for keywords
-        class_format = self.create_format("#42A5F5")  # Blue for class names
-        string_format = self.create_format("#66BB6A")  # Green for strings
-        comment_format = self.create_format("#78909C")  # Gray for comments
-        number_format = self.create_format("#AB47BC")  # Purple for numbers
-        function_format = self.create_format("#FFA726")  # Orange for functions
-
-        # Language-specific patterns
-        if self.language.lower() == 'python':
-            # Python keywords
-            keywords = [
-                'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
-                'del', 'elif', 'else', 'except', 'False', 'finally', 'for',
-                'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'None',
-                'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True',
-                'try', 'while', 'with', 'yield'
-            ]
-
-            # Add keyword patterns
-            for word in keywords:
-                pattern = QRegularExpression(r'\b' + word + r'\b')
-                self.highlighting_rules.append((pattern, keyword_format))
-
-            # Python string patterns (single and double quotes)
-            self.highlighting_rules.extend([
-                (QRegularExpression(r'"[^"\\]*(\\.[^"\\]*)*"'), string_format),
-                (QRegularExpression(r"'[^'\\]*(\\.[^'\\]*)*'"), string_format),
-                # Triple quotes
-                (
-                QRegularExpression(r'""".*?"""', QRegularExpression.PatternOption.DotMatchesEverythingOption), string_format),
-                (
-                QRegularExpression(r"'''.*?'''", QRegularExpression.PatternOption.DotMatchesEverythingOption), string_format),
-            ])
-
-            # Python comments
-            self.highlighting_rules.append(
-                (QRegularExpression(r'#[^\n]*'), comment_format)
-            )
-
-            # Python class names
-            self.highlighting_rules.append(
-                (QRegularExpression(r'\bclass\s+\w+'), class_format)
-            )
-
-            # Python function definitions
-            self.highlighting_rules.append(
-                (QRegularExpression(r'\bdef\s+\w+'), function_format)
-            )
-
-        elif self.language.lower() == 'javascript':
-            # JavaScript keywords
-            keywords = [
-                'break', 'case', 'catch', 'class', 'const', 'continue',
-                'debugger', 'default', 'delete', 'do', 'else', 'export',
-                'extends', 'finally', 'for', 'function', 'if', 'import',
-                'in', 'instanceof', 'new', 'return', 'super', 'switch',
-                'this', 'throw', 'try', 'typeof', 'var', 'void', 'while',
-                'with', 'yield', 'let', 'static', 'enum', 'await', 'async'
-            ]
-
-            for word in keywords:
-                pattern = QRegularExpression(r'\b' + word + r'\b')
-                self.highlighting_rules.append((pattern, keyword_format))
-
-            # JavaScript strings
-            self.highlighting_rules.extend([
-                (QRegularExpression(r'"[^"\\]*(\\.[^"\\]*)*"'), string_format),
-                (QRegularExpression(r"'[^'\\]*(\\.[^'\\]*)*'"), string_format),
-                (QRegularExpression(r'`[^`\\]*(\\.[^`\\]*)*`'), string_format),  # Template literals
-            ])
-
-            # JavaScript comments
-            self.highlighting_rules.extend([
-                (QRegularExpression(r'//[^\n]*'), comment_format),
-                (
-                QRegularExpression(r'/\*.*?\*/', QRegularExpression.PatternOption.DotMatchesEverythingOption), comment_format)
-            ])
-
-        # Common patterns for all languages
-        # Numbers
-        self.highlighting_rules.append(
-            (QRegularExpression(r'\b\d+\b'), number_format)
-        )
-
-    def create_format(self, color, style=None):
-        """Create a text format with specified color and optional style."""
-        text_format = QTextCharFormat()
-        text_format.setForeground(QColor(color))
-        if style:
-            text_format.setFontWeight(style)
-        return text_format
-
-    def highlightBlock(self, text):
-        """Apply highlighting rules to the given block of text."""
-        for pattern, format in self.highlighting_rules:
-            matches = pattern.globalMatch(text)
-            while matches.hasNext():
-                match = matches.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
-
-
-class CodeEditor(QTextEdit):
-    """
-    Enhanced text editor with code editing features like syntax highlighting,
-    line numbers, and auto-indentation.
-    """
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setup_editor()
-        self.highlighter = None
-        self.set_language('python')  # Default to Python
-
-    def setup_editor(self):
-        """Configure the editor with code-friendly settings."""
-        # Use a monospace font
-        font = QFont("Consolas", 12)
-        font.setFixedPitch(True)
-        self.setFont(font)
-
-        # Set tab width
-        self.setTabStopDistance(self.fontMetrics().horizontalAdvance(" ") * 4)
-
-        # Enable line wrapping
-        self.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-
-    def set_language(self, language):
-        """Set the programming language for syntax highlighting."""
-        self.highlighter = CodeSyntaxHighlighter(self.document(), language)
-
-
-class FileEditor(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("SPARK")
-        self.setGeometry(300, 150, 1000, 600)
-        self.setMinimumSize(QSize(1200, 700))
-
-        self.current_file_path = None
-        self.conn = sqlite3.connect('quick_actions.db')
-        self.create_table()
-        self.init_ui()
-        # Initialize SQLite connection here
-        # self.conn = sqlite3.connect('quick_actions.db')
-
-        # Connect to SQLite3 database
-
-
-        # self.connect_to_database()
-
-    def init_ui(self):
-        self.create_toolbar()
-        self.create_status_bar()
-        self.create_main_layout()
-        # Modern UI stylesheet with a clean, professional design
-        self.setStyleSheet("""
+def _create_format(color, style=None):
+    """Create a text format with specified color and optional style."""
+    text_format = QTextCharFormat()
+    text_format.setForeground(QColor(color))
+    if style:
+        text_format.setFontWeight(style)
+    return text_format
+
+
+# Shared text formats for the different code elements. QTextCharFormat is a
+# stateless value type, so a single instance per element can be reused by
+# every rule table without re-parsing the hex colors.
+_FORMATS = {
+    'keyword': _create_format("#FF7043"),  # Orange for keywords
+    'class': _create_format("#42A5F5"),  # Blue for class names
+    'string': _create_format("#66BB6A"),  # Green for strings
+    'comment': _create_format("#78909C"),  # Gray for comments
+    'number': _create_format("#AB47BC"),  # Purple for numbers
+    'function': _create_format("#FFA726"),  # Orange for functions
+}
+
+
+# Keywords as frozensets for O(1) classification during tokenization
+_PY_KEYWORDS = frozenset({
+    'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
+    'del', 'elif', 'else', 'except', 'False', 'finally', 'for',
+    'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'None',
+    'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True',
+    'try', 'while', 'with', 'yield'
+})
+
+_JS_KEYWORDS = frozenset({
+    'break', 'case', 'catch', 'class', 'const', 'continue',
+    'debugger', 'default', 'delete', 'do', 'else', 'export',
+    'extends', 'finally', 'for', 'function', 'if', 'import',
+    'in', 'instanceof', 'new', 'return', 'super', 'switch',
+    'this', 'throw', 'try', 'typeof', 'var', 'void', 'while',
+    'with', 'yield', 'let', 'static', 'enum', 'await', 'async'
+})
+
+def _monospace_font(size):
+    """Build the fixed-pitch editor font once so font metrics stay cached."""
+    font = QFont("Consolas", size)
+    font.setFixedPitch(True)
+    return font
+
+
+# Shared fonts; reusing one instance keeps Qt's font-metrics cache warm
+_EDITOR_FONT = _monospace_font(12)
+_TERMINAL_FONT = _monospace_font(11)
+
+# Resolved once: expanduser can hit getpwuid, and the extension map never
+# changes
+_HOME = os.path.expanduser("~")
+_EXT_LANG = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+}
+
+# Application-wide stylesheet with a clean, professional design. Applied
+# once at QApplication scope so Qt parses it a single time; cards opt in
+# via setObjectName("card") instead of carrying their own stylesheet.
+_APP_STYLE = """
                 /* Main Window - Creating a clean base */
                 QMainWindow {
                     background-color: #f5f6fa;
@@ -418,16 +304,15 @@ class FileEditor(QMainWindow):
                     background-color: #f6f8fa;
                 }
 
-                /* Text Editor - Clean and focused design */
+                /* Text Editor - Clean and focused design; the font comes
+                   from CodeEditor.setup_editor so the stylesheet does not
+                   trigger another relayout on top of it */
                 QTextEdit {
                     background-color: #ffffff;
                     border: none;
                     padding: 15px;
                     selection-background-color: #0366d6;
                     selection-color: white;
-                    font-family: 'Consolas', monospace;
-                    font-size: 14px;
-                    line-height: 1.6;
                 }
 
                 /* Buttons - Modern, flat design */
@@ -482,14 +367,14 @@ class FileEditor(QMainWindow):
                 }
 
                 /* Quick Action Cards - Elevated card design */
-                QWidget[class="card"] {
+                QWidget#card {
                     background-color: white;
                     border: 1px solid #e1e4e8;
                     border-radius: 10px;
                     padding: 15px;
                     margin: 10px;
                 }
-                QWidget[class="card"]:hover {
+                QWidget#card:hover {
                     border-color: #0366d6;
                     background-color: #f8fafd;
                 }
@@ -567,7 +452,348 @@ class FileEditor(QMainWindow):
                     margin: 10px;
                     padding: 10px;
                 }
-            """)
+
+                /* Card action buttons */
+                QPushButton#editBtn {
+                    background-color: green;
+                    color: white;
+                    border-radius: 3px;
+                }
+                QPushButton#deleteBtn {
+                    background-color: red;
+                    color: white;
+                    border-radius: 3px;
+                }
+            """
+
+# Block states used to carry multi-line constructs across highlightBlock calls
+_STATE_NORMAL = 0
+_STATE_TRIPLE_DOUBLE = 1
+_STATE_TRIPLE_SINGLE = 2
+_STATE_JS_BLOCK_COMMENT = 3
+
+
+def _tokenize_python(text, prev_state):
+    """
+    Scan a block of Python source in a single left-to-right pass.
+
+    Returns (tokens, state) where tokens is a list of (start, length, format)
+    tuples ready for setFormat, and state is the block state to carry into the
+    next block (a _STATE_TRIPLE_* value while inside an unterminated
+    triple-quoted string, otherwise _STATE_NORMAL).
+    """
+    tokens = []
+    string_format = _FORMATS['string']
+    n = len(text)
+    i = 0
+
+    # Resume a triple-quoted string left open by the previous block
+    if prev_state in (_STATE_TRIPLE_DOUBLE, _STATE_TRIPLE_SINGLE):
+        quote = '"""' if prev_state == _STATE_TRIPLE_DOUBLE else "'''"
+        end = text.find(quote)
+        if end == -1:
+            tokens.append((0, n, string_format))
+            return tokens, prev_state
+        tokens.append((0, end + 3, string_format))
+        i = end + 3
+
+    prev_word = None
+    while i < n:
+        ch = text[i]
+
+        if ch == '#':
+            tokens.append((i, n - i, _FORMATS['comment']))
+            break
+
+        if ch == '"' or ch == "'":
+            triple = ch * 3
+            if text.startswith(triple, i):
+                end = text.find(triple, i + 3)
+                if end == -1:
+                    tokens.append((i, n - i, string_format))
+                    state = _STATE_TRIPLE_DOUBLE if ch == '"' else _STATE_TRIPLE_SINGLE
+                    return tokens, state
+                tokens.append((i, end + 3 - i, string_format))
+                i = end + 3
+            else:
+                # Single-line string, honouring backslash escapes
+                j = i + 1
+                while j < n and text[j] != ch:
+                    j += 2 if text[j] == '\\' else 1
+                j = min(j + 1, n)
+                tokens.append((i, j - i, string_format))
+                i = j
+            prev_word = None
+            continue
+
+        if ch.isdigit():
+            j = i + 1
+            while j < n and text[j].isdigit():
+                j += 1
+            tokens.append((i, j - i, _FORMATS['number']))
+            i = j
+            prev_word = None
+            continue
+
+        if ch.isalpha() or ch == '_':
+            j = i + 1
+            while j < n and (text[j].isalnum() or text[j] == '_'):
+                j += 1
+            word = text[i:j]
+            if word in _PY_KEYWORDS:
+                tokens.append((i, j - i, _FORMATS['keyword']))
+            elif prev_word == 'class':
+                tokens.append((i, j - i, _FORMATS['class']))
+            elif prev_word == 'def':
+                tokens.append((i, j - i, _FORMATS['function']))
+            prev_word = word
+            i = j
+            continue
+
+        if not ch.isspace():
+            prev_word = None
+        i += 1
+
+    return tokens, _STATE_NORMAL
+
+
+def _tokenize_javascript(text, prev_state):
+    """
+    Scan a block of JavaScript source in a single left-to-right pass.
+
+    Same contract as _tokenize_python; the carried block state is
+    _STATE_JS_BLOCK_COMMENT while inside an unterminated /* */ comment.
+    """
+    tokens = []
+    string_format = _FORMATS['string']
+    comment_format = _FORMATS['comment']
+    n = len(text)
+    i = 0
+
+    # Resume a block comment left open by the previous block
+    if prev_state == _STATE_JS_BLOCK_COMMENT:
+        end = text.find('*/')
+        if end == -1:
+            tokens.append((0, n, comment_format))
+            return tokens, prev_state
+        tokens.append((0, end + 2, comment_format))
+        i = end + 2
+
+    while i < n:
+        ch = text[i]
+
+        if ch == '/' and i + 1 < n:
+            nxt = text[i + 1]
+            if nxt == '/':
+                tokens.append((i, n - i, comment_format))
+                break
+            if nxt == '*':
+                end = text.find('*/', i + 2)
+                if end == -1:
+                    tokens.append((i, n - i, comment_format))
+                    return tokens, _STATE_JS_BLOCK_COMMENT
+                tokens.append((i, end + 2 - i, comment_format))
+                i = end + 2
+                continue
+
+        if ch == '"' or ch == "'" or ch == '`':
+            # Single-line string or template literal, honouring escapes
+            j = i + 1
+            while j < n and text[j] != ch:
+                j += 2 if text[j] == '\\' else 1
+            j = min(j + 1, n)
+            tokens.append((i, j - i, string_format))
+            i = j
+            continue
+
+        if ch.isdigit():
+            j = i + 1
+            while j < n and text[j].isdigit():
+                j += 1
+            tokens.append((i, j - i, _FORMATS['number']))
+            i = j
+            continue
+
+        if ch.isalpha() or ch == '_' or ch == '$':
+            j = i + 1
+            while j < n and (text[j].isalnum() or text[j] in '_$'):
+                j += 1
+            if text[i:j] in _JS_KEYWORDS:
+                tokens.append((i, j - i, _FORMATS['keyword']))
+            i = j
+            continue
+
+        i += 1
+
+    return tokens, _STATE_NORMAL
+
+
+# Scanner dispatch table; languages not listed here get no highlighting
+_TOKENIZERS = {
+    'python': _tokenize_python,
+    'javascript': _tokenize_javascript,
+}
+
+
+class CodeSyntaxHighlighter(QSyntaxHighlighter):
+    """
+    A syntax highlighter for programming code that supports multiple languages.
+    Provides color-coding for keywords, strings, comments, and other code elements.
+    """
+
+    # Upper bound on cached lines; beyond this the least recently used
+    # entry is evicted
+    _CACHE_SIZE = 4096
+
+    def __init__(self, parent, language='python'):
+        super().__init__(parent)
+        self.language = language
+        self._tokenize = _TOKENIZERS.get(language.lower())
+        # LRU of (line, incoming state) -> (tokens, outgoing state), so
+        # rehighlights of unchanged lines replay recorded setFormat calls
+        # instead of re-scanning
+        self._token_cache = OrderedDict()
+
+    def highlightBlock(self, text):
+        """Apply highlighting to the given block of text."""
+        if self._tokenize is None:
+            return
+
+        # Blank lines have nothing to highlight unless a multi-line
+        # construct from the previous block runs through them
+        if (not text or text.isspace()) and self.previousBlockState() <= _STATE_NORMAL:
+            self.setCurrentBlockState(_STATE_NORMAL)
+            return
+
+        prev_state = self.previousBlockState()
+        if prev_state == -1:
+            prev_state = _STATE_NORMAL
+
+        key = (text, prev_state)
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self._token_cache.move_to_end(key)
+            tokens, state = cached
+        else:
+            tokens, state = self._tokenize(text, prev_state)
+            self._token_cache[key] = (tokens, state)
+            if len(self._token_cache) > self._CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+
+        self.setCurrentBlockState(state)
+        for start, length, token_format in tokens:
+            self.setFormat(start, length, token_format)
+
+
+class CodeEditor(QTextEdit):
+    """
+    Enhanced text editor with code editing features like syntax highlighting,
+    line numbers, and auto-indentation.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_editor()
+        self.highlighter = None
+        self._highlighters = {}  # One cached highlighter per language
+        self.set_language('python')  # Default to Python
+
+    def setup_editor(self):
+        """Configure the editor with code-friendly settings."""
+        # Use the shared monospace font
+        self.setFont(_EDITOR_FONT)
+
+        # Set tab width
+        self.setTabStopDistance(self.fontMetrics().horizontalAdvance(" ") * 4)
+
+        # Enable line wrapping
+        self.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+
+    def set_language(self, language):
+        """Set the programming language for syntax highlighting."""
+        if self.highlighter is not None:
+            self.highlighter.setDocument(None)
+        highlighter = self._highlighters.get(language)
+        if highlighter is None:
+            highlighter = CodeSyntaxHighlighter(None, language)
+            self._highlighters[language] = highlighter
+        highlighter.setDocument(self.document())
+        self.highlighter = highlighter
+
+    def clear_language(self):
+        """Detach syntax highlighting for plain-text editing."""
+        if self.highlighter is not None:
+            self.highlighter.setDocument(None)
+            self.highlighter = None
+
+
+class FileFilterProxyModel(QSortFilterProxyModel):
+    """
+    Name filter for the file tree that only ever hides file rows.
+
+    The stock filterAcceptsRow tests every row, directories included, so a
+    pattern that does not match the path components above the view's root
+    (e.g. the home directory) would reject the root's ancestor chain and
+    blank the whole tree. Directories always pass; files match the pattern.
+    """
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        source = self.sourceModel()
+        if source.isDir(source.index(source_row, 0, source_parent)):
+            return True
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
+class FileEditor(QMainWindow):
+    # SQL for the card CRUD paths lives in class constants: each call passes
+    # the identical string object, so sqlite3's per-connection statement
+    # cache reuses the compiled statement instead of re-parsing the SQL.
+    # Titles and content bodies live in separate tables so listing cards
+    # only reads the small title rows; content is fetched per card.
+    _SQL_INSERT_TITLE = "INSERT INTO quick_actions (title) VALUES (?)"
+    _SQL_INSERT_CONTENT = "INSERT INTO quick_actions_content (id, content) VALUES (?, ?)"
+    _SQL_UPDATE_TITLE = "UPDATE quick_actions SET title = ? WHERE id = ?"
+    _SQL_UPDATE_CONTENT = "UPDATE quick_actions_content SET content = ? WHERE id = ?"
+    _SQL_DELETE = "DELETE FROM quick_actions WHERE id = ?"
+    _SQL_SELECT_ALL = "SELECT id, title FROM quick_actions ORDER BY id"
+    _SQL_SELECT_CONTENT = "SELECT content FROM quick_actions_content WHERE id = ?"
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("SPARK")
+        self.setGeometry(300, 150, 1000, 600)
+        self.setMinimumSize(QSize(1200, 700))
+
+        self.current_file_path = None
+        # None until the first load; afterwards the parallel lists double as
+        # a process-lifetime cache for repeat refreshes of the pane
+        self._card_ids = None
+        self._pending_card_rows = deque()
+        self._edit_dialog = None
+        self.conn = sqlite3.connect('quick_actions.db', cached_statements=256)
+        # WAL with relaxed sync keeps per-commit fsync cost off the UI thread;
+        # a 20 MB page cache and a busy timeout avoid re-reads and
+        # SQLITE_BUSY errors surfacing as exceptions in UI handlers
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.create_table()
+        self.init_ui()
+        # Initialize SQLite connection here
+        # self.conn = sqlite3.connect('quick_actions.db')
+
+        # Connect to SQLite3 database
+
+
+        # self.connect_to_database()
+
+    def init_ui(self):
+        self.create_toolbar()
+        self.create_status_bar()
+        self.create_main_layout()
 
     def connect_to_database(self):
         try:
@@ -597,6 +823,14 @@ class FileEditor(QMainWindow):
         self.search_bar.setPlaceholderText("Search Files")
         toolbar.addWidget(self.search_bar)
 
+        # Debounce typing so a burst of keystrokes becomes one filter pass
+        # over the already-loaded model instead of one per key
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_file_filter)
+        self.search_bar.textChanged.connect(lambda _: self._filter_timer.start())
+
         create_card_button = QPushButton("Create Quick Action Card")
         create_card_button.clicked.connect(self.create_card_from_toolbar)
         toolbar.addWidget(create_card_button)
@@ -634,13 +868,27 @@ class FileEditor(QMainWindow):
         self.setCentralWidget(container)
 
     def create_file_system_view(self, parent_splitter):
-        home_directory = os.path.expanduser("~")
+        home_directory = _HOME
         file_system_model = QFileSystemModel()
+        # Skip per-directory custom icon extraction; the default icons avoid
+        # an extra stat/lookup for every visible row. Watching stays on
+        # because create_item relies on the model noticing new entries.
+        file_system_model.setOption(
+            QFileSystemModel.Option.DontUseCustomDirectoryIcons, True
+        )
         file_system_model.setRootPath(home_directory)
+        self.file_system_model = file_system_model
+
+        # Filter in-memory over the loaded model instead of re-reading the
+        # filesystem; the search bar drives setFilterRegularExpression
+        self.file_system_proxy = FileFilterProxyModel(self)
+        self.file_system_proxy.setSourceModel(file_system_model)
 
         self.tree_view = QTreeView()
-        self.tree_view.setModel(file_system_model)
-        self.tree_view.setRootIndex(file_system_model.index(home_directory))
+        self.tree_view.setModel(self.file_system_proxy)
+        self.tree_view.setRootIndex(
+            self.file_system_proxy.mapFromSource(file_system_model.index(home_directory))
+        )
         self.tree_view.clicked.connect(self.on_tree_view_clicked)
         self.tree_view.setHeaderHidden(True)
         self.tree_view.setMinimumWidth(180)
@@ -653,59 +901,64 @@ class FileEditor(QMainWindow):
 
     def create_editor_view(self, parent_splitter):
         self.editor = CodeEditor()
-        self.editor.setFont(QFont("System", 12))
         self.editor.setPlaceholderText("Select a file to start editing...")
         self.editor.setDisabled(True)
 
         editor_widget = QWidget()
         layout = QVBoxLayout(editor_widget)
 
-        layout.addWidget(self.editor)
+        # Add language selector above the editor; open_file keeps it in sync
+        # with the detected language
+        header_layout = QHBoxLayout()
+        self.language_selector = QComboBox()
+        self.language_selector.addItems(['Plain Text', 'Python', 'JavaScript'])
+        self.language_selector.currentTextChanged.connect(self.change_language)
+        header_layout.addWidget(self.language_selector)
+        header_layout.addStretch()
+        layout.addLayout(header_layout)
 
-        # Add header with language selector
-        # header_layout = QHBoxLayout()
-        # header = QLabel("Editor")
-        # header.setObjectName("headerLabel")
-        # header_layout.addWidget(header)
-        #
-        # # Add language selector
-        # self.language_selector = QComboBox()
-        # self.language_selector.addItems(['Plain Text', 'Python', 'JavaScript'])
-        # self.language_selector.currentTextChanged.connect(self.change_language)
-        # header_layout.addWidget(self.language_selector)
-        # header_layout.addStretch()
-        # layout.addLayout(header_layout)
+        layout.addWidget(self.editor)
 
         parent_splitter.addWidget(editor_widget)
 
     def change_language(self, language):
         """Change the syntax highlighting language."""
         if language == 'Plain Text':
-            self.editor.highlighter = None
-            self.editor.document().setPlainText(self.editor.toPlainText())
+            self.editor.clear_language()
         else:
             self.editor.set_language(language.lower())
 
     def open_file(self, path):
         """Open and display a file with appropriate syntax highlighting."""
         try:
+            file_size = os.path.getsize(path)
             self.current_file_path = path
-            with open(path, 'r') as file:
-                content = file.read()
+            # Read the raw bytes in one go and decode once; errors='replace'
+            # keeps files with stray non-UTF-8 bytes from raising
+            with open(path, 'rb') as file:
+                content = file.read().decode('utf-8', errors='replace')
 
             # Detect language from file extension
             ext = os.path.splitext(path)[1].lower()
-            language_map = {
-                '.py': 'Python',
-                '.js': 'JavaScript',
-            }
+            detected_language = _EXT_LANG.get(ext, 'Plain Text')
+
+            # Rehighlighting a very large document synchronously stalls the
+            # UI, so fall back to plain text beyond the size guard
+            if file_size > 2_000_000:
+                detected_language = 'Plain Text'
 
             # Set language in selector and apply highlighting
-            detected_language = language_map.get(ext, 'Plain Text')
             self.language_selector.setCurrentText(detected_language)
 
-            # Set content
+            # Detach the highlighter while the document is replaced;
+            # reattaching afterwards schedules a single rehighlight instead
+            # of running the rules on every block as it is inserted
+            highlighter = self.editor.highlighter
+            if highlighter is not None:
+                highlighter.setDocument(None)
             self.editor.setPlainText(content)
+            if highlighter is not None:
+                highlighter.setDocument(self.editor.document())
             self.editor.setDisabled(False)
             self.status_bar.showMessage(f"Opened: {path}")
 
@@ -728,17 +981,33 @@ class FileEditor(QMainWindow):
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)  # Hide horizontal scrollbar
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.scroll_area.setStyleSheet("background-color: #f8f9fa; padding:0px;")
+        # The viewport is fully covered by the opaque pane background, so
+        # let the paint event own every pixel and skip the pre-paint erase
+        self.scroll_area.viewport().setAttribute(
+            Qt.WidgetAttribute.WA_OpaquePaintEvent, True
+        )
+        # Recycled card widgets: deleting a card parks its subtree here so
+        # the next create only has to set two label texts instead of
+        # building six QObjects and reconnecting signals
+        self._card_pool = deque()
         self.scroll_area_widget = QWidget()
         self.scroll_area_layout = QVBoxLayout()
         self.scroll_area_widget.setLayout(self.scroll_area_layout)
         self.scroll_area.setWidget(self.scroll_area_widget)
+        # Realize card widgets on demand: rows beyond the current scroll
+        # position stay as unread cursor rows instead of live widget trees,
+        # so memory and layout cost track what the user has actually seen
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self._maybe_load_more_cards
+        )
         quick_action_layout.addWidget(self.scroll_area)
 
         # self.create_card_form(quick_action_layout)
 
         parent_splitter.addWidget(quick_action_pane)
 
-        self.load_cards_from_db()
+        # Defer the card load so the window paints before widgets are built
+        QTimer.singleShot(0, self.load_cards_from_db)
 
     def create_card_form(self, layout):
         form_layout = QFormLayout()
@@ -757,27 +1026,33 @@ class FileEditor(QMainWindow):
 
         layout.addLayout(form_layout)
 
+    def _apply_file_filter(self):
+        """Apply the debounced search-bar text as a filter on the tree."""
+        text = self.search_bar.text()
+        self.file_system_proxy.setFilterRegularExpression(
+            QRegularExpression(
+                QRegularExpression.escape(text),
+                QRegularExpression.PatternOption.CaseInsensitiveOption,
+            )
+        )
+        # Re-anchor the root: invalidating the filter rebuilds the proxy
+        # mapping, and the view's persistent root index does not survive it
+        self.tree_view.setRootIndex(
+            self.file_system_proxy.mapFromSource(self.file_system_model.index(_HOME))
+        )
+
     def on_tree_view_clicked(self, index):
-        path = self.tree_view.model().filePath(index)
-        if not self.tree_view.model().isDir(index):
+        source_index = self.file_system_proxy.mapToSource(index)
+        path = self.file_system_model.filePath(source_index)
+        if not self.file_system_model.isDir(source_index):
             self.open_file(path)
 
-    def open_file(self, path):
-        try:
-            self.current_file_path = path
-            with open(path, 'r') as file:
-                self.editor.setText(file.read())
-            self.editor.setDisabled(False)
-            self.status_bar.showMessage(path)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
-
     def create_new_item(self):
         dialog = NewItemDialog(self)
         if dialog.exec():
             item_type, name = dialog.get_inputs()
-            index = self.tree_view.currentIndex()
-            path = self.tree_view.model().filePath(index)
+            source_index = self.file_system_proxy.mapToSource(self.tree_view.currentIndex())
+            path = self.file_system_model.filePath(source_index)
             self.create_item(item_type, name, path)
 
     def create_item(self, item_type, name, path):
@@ -792,9 +1067,12 @@ class FileEditor(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to create {item_type.lower()}: {e}")
 
     def refresh_file_system_view(self):
-        home_directory = os.path.expanduser("~")
-        self.tree_view.model().setRootPath('')
-        self.tree_view.setRootIndex(self.tree_view.model().index(home_directory))
+        # QFileSystemModel watches directories natively, so newly created
+        # files show up on their own; re-pointing the root index is enough
+        # and avoids invalidating the whole model cache with setRootPath('')
+        self.tree_view.setRootIndex(
+            self.file_system_proxy.mapFromSource(self.file_system_model.index(_HOME))
+        )
 
     def save_current_file(self):
         if self.current_file_path:
@@ -812,34 +1090,32 @@ class FileEditor(QMainWindow):
         title = self.card_title_input.text().strip()
         content = self.card_content_input.toPlainText().strip()
 
-        if not title or not content:
+        if not (title and content):
             QMessageBox.warning(self, "Input Error", "Both title and content are required.")
             return
 
-        card_widget = self.create_card_widget(title, content)
+        card_id = self.save_card_to_db(title, content)
+        self._card_ids.append(card_id)
+        self._card_titles.append(title)
+        self._card_contents.append(content)
+        card_widget = self.create_card_widget(card_id, title, content)
         self.scroll_area_layout.addWidget(card_widget)
 
-        self.save_card_to_db(title, content)
-
         self.card_title_input.clear()
         self.card_content_input.clear()
 
-    def create_card_widget(self, title, content):
+    def create_card_widget(self, card_id, title, content):
+        if self._card_pool:
+            card_widget = self._card_pool.popleft()
+            card_widget.setProperty("card_id", card_id)
+            card_widget._title_label.setText(title)
+            card_widget._content_label.setText(content)
+            card_widget.show()
+            return card_widget
+
         card_widget = QWidget()
-        card_widget.setStyleSheet("""
-                                  QWidget {
-                background-color: white;
-                border-radius: 8px;
-                padding: 12px;
-                margin: 8px;
-                
-            }
-            QWidget:hover {
-            border: 2px solid #e9ecef;
-                border-color: #0d6efd;
-            }
-        """)
-        layout = QVBoxLayout()
+        card_widget.setProperty("card_id", card_id)
+        card_widget.setObjectName("card")
         layout = QVBoxLayout()
 
         card_title = QLabel(title)
@@ -851,91 +1127,229 @@ class FileEditor(QMainWindow):
 
         actions_layout = QHBoxLayout()
         edit_button = QPushButton("Edit")
-        edit_button.setStyleSheet("background-color: green; color: white; border-radius: 3px;")
-        edit_button.clicked.connect(lambda: self.edit_card(card_widget, title, content))
+        edit_button.setObjectName("editBtn")
+        # Both buttons share the two bound handlers below and find their
+        # card through sender(), so no per-card closures are created
+        edit_button._card_widget = card_widget
+        edit_button.clicked.connect(self._on_edit_clicked)
         actions_layout.addWidget(edit_button)
 
         delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet("background-color: red; color: white; border-radius: 3px;")
-        delete_button.clicked.connect(lambda: self.delete_card(card_widget, title))
+        delete_button.setObjectName("deleteBtn")
+        delete_button._card_widget = card_widget
+        delete_button.clicked.connect(self._on_delete_clicked)
         actions_layout.addWidget(delete_button)
 
         layout.addLayout(actions_layout)
 
         card_widget.setLayout(layout)
+
+        # Keep direct references so edit_card does not have to walk the
+        # widget tree with findChild/findChildren
+        card_widget._title_label = card_title
+        card_widget._content_label = card_content
         return card_widget
 
-    def edit_card(self, card_widget, old_title, old_content):
-        title, content = self.get_card_edit_input(old_title, old_content)
-        if title and content:
-            card_widget.findChild(QLabel).setText(title)
-            card_widget.findChildren(QLabel)[1].setText(content)
-            self.update_card_in_db(old_title, title, content)
+    def _on_edit_clicked(self):
+        self.edit_card(self.sender()._card_widget)
+
+    def _on_delete_clicked(self):
+        self.delete_card(self.sender()._card_widget)
 
-    def delete_card(self, card_widget, title):
+    def edit_card(self, card_widget):
+        title, content = self.get_card_edit_input(
+            card_widget._title_label.text(), card_widget._content_label.text()
+        )
+        if title and content:
+            card_widget._title_label.setText(title)
+            card_widget._content_label.setText(content)
+            card_id = card_widget.property("card_id")
+            row = self._card_ids.index(card_id)
+            self._card_titles[row] = title
+            self._card_contents[row] = content
+            self.update_card_in_db(card_id, title, content)
+
+    def delete_card(self, card_widget):
         self.scroll_area_layout.removeWidget(card_widget)
-        card_widget.deleteLater()
-        self.delete_card_from_db(title)
+        card_widget.hide()
+        self._card_pool.append(card_widget)
+        card_id = card_widget.property("card_id")
+        row = self._card_ids.index(card_id)
+        del self._card_ids[row]
+        del self._card_titles[row]
+        del self._card_contents[row]
+        self.delete_card_from_db(card_id)
 
     def get_card_edit_input(self, old_title, old_content):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Edit Quick Action Card")
-
-        form_layout = QFormLayout()
-        title_input = QLineEdit(old_title)
-        content_input = QTextEdit(old_content)
-        form_layout.addRow("Title", title_input)
-        form_layout.addRow("Content", content_input)
-
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        form_layout.addRow(button_box)
-
-        dialog.setLayout(form_layout)
-        if dialog.exec():
-            return title_input.text().strip(), content_input.toPlainText().strip()
+        # The dialog is built once and reused; opening it again is two
+        # setText calls instead of constructing and destroying the whole
+        # form every time
+        if self._edit_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Edit Quick Action Card")
+
+            form_layout = QFormLayout()
+            self._edit_title_input = QLineEdit()
+            self._edit_content_input = QTextEdit()
+            form_layout.addRow("Title", self._edit_title_input)
+            form_layout.addRow("Content", self._edit_content_input)
+
+            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+            button_box.accepted.connect(dialog.accept)
+            button_box.rejected.connect(dialog.reject)
+            form_layout.addRow(button_box)
+
+            dialog.setLayout(form_layout)
+            self._edit_dialog = dialog
+
+        self._edit_title_input.setText(old_title)
+        self._edit_content_input.setPlainText(old_content)
+        if self._edit_dialog.exec():
+            return (
+                self._edit_title_input.text().strip(),
+                self._edit_content_input.toPlainText().strip(),
+            )
         return None, None
 
     def save_card_to_db(self, title, content):
-        cursor = self.conn.cursor()
-        cursor.execute("INSERT INTO quick_actions (title, content) VALUES (?, ?)", (title, content))
-        self.conn.commit()
-
-    def update_card_in_db(self, old_title, new_title, new_content):
-        cursor = self.conn.cursor()
-        cursor.execute("UPDATE quick_actions SET title = ?, content = ? WHERE title = ?", (new_title, new_content, old_title))
-        self.conn.commit()
-
-    def delete_card_from_db(self, title):
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM quick_actions WHERE title = ?", (title,))
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute(self._SQL_INSERT_TITLE, (title,))
+            self.conn.execute(self._SQL_INSERT_CONTENT, (cursor.lastrowid, content))
+        return cursor.lastrowid
+
+    def update_card_in_db(self, card_id, new_title, new_content):
+        with self.conn:
+            self.conn.execute(self._SQL_UPDATE_TITLE, (new_title, card_id))
+            self.conn.execute(self._SQL_UPDATE_CONTENT, (new_content, card_id))
+
+    def delete_card_from_db(self, card_id):
+        # The content row goes with it via ON DELETE CASCADE
+        with self.conn:
+            self.conn.execute(self._SQL_DELETE, (card_id,))
+
+    def save_cards_bulk(self, rows):
+        """Insert many (title, content) rows in one transaction."""
+        with self.conn:
+            for title, content in rows:
+                cursor = self.conn.execute(self._SQL_INSERT_TITLE, (title,))
+                self.conn.execute(
+                    self._SQL_INSERT_CONTENT, (cursor.lastrowid, content)
+                )
 
     def load_cards_from_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT title, content FROM quick_actions")
-        for title, content in cursor.fetchall():
-            card_widget = self.create_card_widget(title, content)
-            self.scroll_area_layout.addWidget(card_widget)
+        if self._card_ids is not None:
+            # The mirror is kept in sync by every write path, so a repeat
+            # refresh never needs to go back to SQLite
+            self._rebuild_cards_from_cache()
+            return
+        # Snapshot the id/title rows up front instead of holding a cursor
+        # open across event-loop turns: an open cursor on this connection
+        # would see rows INSERTed by create_card and feed the new card back
+        # into the batch loop as a duplicate. Title rows are tiny, so the
+        # snapshot costs little; content is still fetched per batch.
+        self._pending_card_rows = deque(self.conn.execute(self._SQL_SELECT_ALL))
+        # In-memory mirror of the table as three parallel lists. Filtering
+        # or searching cards is then one tight loop over one flat list
+        # instead of a query or a walk over widget trees.
+        self._card_ids = []
+        self._card_titles = []
+        self._card_contents = []
+        self._load_next_card_batch()
+
+    def _rebuild_cards_from_cache(self):
+        """Repopulate the pane from the mirror without touching the database."""
+        while self.scroll_area_layout.count():
+            item = self.scroll_area_layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                self._card_pool.append(widget)
+        self.scroll_area_widget.setUpdatesEnabled(False)
+        try:
+            rows = zip(self._card_ids, self._card_titles, self._card_contents)
+            for card_id, title, content in rows:
+                card_widget = self.create_card_widget(card_id, title, content)
+                self.scroll_area_layout.addWidget(card_widget)
+        finally:
+            self.scroll_area_widget.setUpdatesEnabled(True)
+
+    def _load_next_card_batch(self, batch_size=20):
+        """Build card widgets in batches so the UI can paint between them."""
+        pending = self._pending_card_rows
+        if not pending:
+            return
+        batch = [pending.popleft() for _ in range(min(batch_size, len(pending)))]
+        # Suspend painting while the batch is inserted so the scroll area
+        # lays out and repaints once per batch, not once per addWidget
+        self.scroll_area_widget.setUpdatesEnabled(False)
+        try:
+            for card_id, title in batch:
+                row = self.conn.execute(
+                    self._SQL_SELECT_CONTENT, (card_id,)
+                ).fetchone()
+                content = row[0] if row else ""
+                self._card_ids.append(card_id)
+                self._card_titles.append(title)
+                self._card_contents.append(content)
+                card_widget = self.create_card_widget(card_id, title, content)
+                self.scroll_area_layout.addWidget(card_widget)
+        finally:
+            self.scroll_area_widget.setUpdatesEnabled(True)
+        # Keep filling only until the pane overflows; after that, further
+        # rows are realized by _maybe_load_more_cards as the user scrolls
+        if pending and self.scroll_area.verticalScrollBar().maximum() == 0:
+            QTimer.singleShot(0, self._load_next_card_batch)
+
+    def _maybe_load_more_cards(self, value):
+        """Realize the next batch when the user nears the bottom."""
+        if not self._pending_card_rows:
+            return
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if value >= scrollbar.maximum() - scrollbar.pageStep():
+            self._load_next_card_batch()
 
     def create_table(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS quick_actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS quick_actions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS quick_actions_content (
+                    id INTEGER PRIMARY KEY
+                        REFERENCES quick_actions(id) ON DELETE CASCADE,
+                    content TEXT NOT NULL
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_quick_actions_title ON quick_actions(title)"
             )
-        """)
-        self.conn.commit()
+            self._migrate_content_column()
+
+    def _migrate_content_column(self):
+        """One-time move of content blobs out of the single-table schema."""
+        columns = [
+            row[1] for row in self.conn.execute("PRAGMA table_info(quick_actions)")
+        ]
+        if 'content' not in columns:
+            return
+        self.conn.execute(
+            "INSERT OR IGNORE INTO quick_actions_content (id, content) "
+            "SELECT id, content FROM quick_actions"
+        )
+        self.conn.execute("ALTER TABLE quick_actions DROP COLUMN content")
 
     def create_card_from_toolbar(self):
         title, content = self.get_card_edit_input("", "")
         if title and content:
-            card_widget = self.create_card_widget(title, content)
+            card_id = self.save_card_to_db(title, content)
+            self._card_ids.append(card_id)
+            self._card_titles.append(title)
+            self._card_contents.append(content)
+            card_widget = self.create_card_widget(card_id, title, content)
             self.scroll_area_layout.addWidget(card_widget)
-            self.save_card_to_db(title, content)
 
 
 class NewItemDialog(QDialog):
@@ -964,17 +1378,26 @@ class NewItemDialog(QDialog):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(_APP_STYLE)
 
-    # Splash screen
+    # Splash screen; shown and painted before the main window is built
     splash_pix = QPixmap("splash.png")  # Ensure this image path is correct
     splash = QSplashScreen(splash_pix, Qt.WindowType.SplashScreen)
-    splash.setMask(splash_pix.mask())
+    # Deriving the mask scans every pixel of the PNG, so bake it to a
+    # 1-bit bitmap on first run and load that directly afterwards
+    splash_mask = QBitmap("splash_mask.bmp")
+    if splash_mask.isNull():
+        splash_mask = splash_pix.mask()
+        splash_mask.save("splash_mask.bmp")
+    splash.setMask(splash_mask)
     splash.show()
+    app.processEvents()
 
     main_win = FileEditor()
 
-    # Simulating a long startup task
-    QTimer.singleShot(3000, main_win.show)  # Show the main window after 3 seconds
-    QTimer.singleShot(3000, splash.close)  # Close the splash screen after 3 seconds
+    # Show as soon as initialization is done instead of waiting out a timer;
+    # splash.finish waits for the main window to be exposed
+    main_win.show()
+    splash.finish(main_win)
 
     sys.exit(app.exec())